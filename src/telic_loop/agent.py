@@ -15,6 +15,7 @@ import re
 import time
 from collections.abc import AsyncGenerator, AsyncIterable
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -75,13 +76,19 @@ class AgentRole(Enum):
     EVALUATOR = ("model_reasoning", "sdk_timeout_reasoning", 40, "readonly")
 
 
+@lru_cache(maxsize=None)
+def _read_prompt_template(name: str) -> str:
+    """Read a prompt template once per process — templates ship with the package."""
+    return (Path(__file__).parent / "prompts" / f"{name}.md").read_text(encoding="utf-8")
+
+
 def load_prompt(name: str, **kwargs: str) -> str:
     """Load a prompt template and safely format placeholders.
 
     Uses string replacement instead of str.format() to avoid conflicts
     with literal braces in JSON examples within prompt templates.
     """
-    template = (Path(__file__).parent / "prompts" / f"{name}.md").read_text(encoding="utf-8")
+    template = _read_prompt_template(name)
     for key, value in kwargs.items():
         template = template.replace(f"{{{key}}}", str(value))
     return template
@@ -369,12 +376,15 @@ def _is_rate_limit_error(text: str) -> bool:
     return any(phrase in lower for phrase in _RATE_LIMIT_PATTERNS)
 
 
+_RATE_LIMIT_RESET_RE = re.compile(r"resets\s+(\d{1,2})\s*(am|pm)", re.IGNORECASE)
+
+
 def parse_rate_limit_wait_seconds(error: RateLimitError) -> int:
     """Parse the reset time from a rate limit error and return seconds to wait."""
     from datetime import datetime, timedelta
 
     hint = error.reset_hint or str(error)
-    match = re.search(r"resets\s+(\d{1,2})\s*(am|pm)", hint, re.IGNORECASE)
+    match = _RATE_LIMIT_RESET_RE.search(hint)
     if match:
         hour = int(match.group(1))
         ampm = match.group(2).lower()
@@ -45,6 +45,14 @@ _RATE_LIMIT_PATTERNS = [
 ]
 
 
+_NON_RETRYABLE_EXC_TYPES = {
+    # Auth-related
+    "AuthenticationError", "PermissionError",
+    # JSON/data corruption
+    "JSONDecodeError", "MissingValueError", "WrongTypeError",
+}
+
+
 def classify_error(exc: Exception) -> str:
     """Classify an exception as 'retryable', 'rate_limit', or 'non_retryable'.
 
@@ -66,12 +74,8 @@ def classify_error(exc: Exception) -> str:
     if any(p in msg for p in _NON_RETRYABLE_PATTERNS):
         return "non_retryable"
 
-    # Auth-related exception types
-    if exc_type in ("AuthenticationError", "PermissionError"):
-        return "non_retryable"
-
-    # JSON/data corruption
-    if exc_type in ("JSONDecodeError", "MissingValueError", "WrongTypeError"):
+    # Auth failures and JSON/data corruption
+    if exc_type in _NON_RETRYABLE_EXC_TYPES:
         return "non_retryable"
 
     # Default: retryable (phase budget is the safety net)
@@ -87,27 +91,22 @@ def backoff_seconds(attempt: int, base: float = 1.0, cap: float = 30.0) -> float
     return min(base * (2 ** attempt), cap)
 
 
+_RETRY_HINT_PATTERNS = [
+    re.compile(r"retry[- ]?after[:\s]+(\d+)\s*s?(?:econds?)?", re.IGNORECASE),
+    re.compile(r"retry\s+in\s+(\d+)\s*s(?:econds?)?", re.IGNORECASE),
+]
+
+
 def parse_retry_after(error_text: str, cap: float = 30.0) -> float | None:
     """Extract a retry-after hint (seconds) from an error message.
 
     Looks for patterns like 'retry after 5s', 'retry in 10 seconds',
     'Retry-After: 30'.
     """
-    match = re.search(
-        r"retry[- ]?after[:\s]+(\d+)\s*s?(?:econds?)?",
-        error_text,
-        re.IGNORECASE,
-    )
-    if match:
-        return min(float(match.group(1)), cap)
-
-    match = re.search(
-        r"retry\s+in\s+(\d+)\s*s(?:econds?)?",
-        error_text,
-        re.IGNORECASE,
-    )
-    if match:
-        return min(float(match.group(1)), cap)
+    for pattern in _RETRY_HINT_PATTERNS:
+        match = pattern.search(error_text)
+        if match:
+            return min(float(match.group(1)), cap)
 
     return None
 
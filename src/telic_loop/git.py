@@ -79,11 +79,12 @@ def _stage_safe_files(config: LoopConfig, state: LoopState) -> None:
 
 def _unstage_sensitive_files(state: LoopState) -> None:
     """Remove sensitive files from the staging area."""
-    staged = _run_git("diff", "--cached", "--name-only").splitlines()
-    for f in staged:
-        if _matches_sensitive_pattern(f, state.git.sensitive_patterns):
-            _run_git_quiet("reset", "HEAD", f)
-            print(f"  WARNING: Unstaged sensitive file: {f}")
+    sensitive = check_sensitive_files(state)
+    if not sensitive:
+        return
+    _run_git_quiet("reset", "HEAD", "--", *sensitive)
+    for f in sensitive:
+        print(f"  WARNING: Unstaged sensitive file: {f}")
 
 
 def git_commit(config: LoopConfig, state: LoopState, message: str) -> None:
@@ -159,13 +160,14 @@ def _revert_tasks_to_checkpoint(state: LoopState, checkpoint: GitCheckpoint,
 def _reset_verifications_to_checkpoint(state: LoopState,
                                         checkpoint: GitCheckpoint) -> None:
     """Reset verifications to checkpoint state."""
+    passing = set(checkpoint.verifications_passing)
     for vid, v in state.verifications.items():
-        if vid in checkpoint.verifications_passing:
+        if vid in passing:
             v.status = "passed"
         else:
             v.status = "pending"
             v.failures = []
-    state.regression_baseline = set(checkpoint.verifications_passing)
+    state.regression_baseline = passing
 
 
 def execute_rollback(
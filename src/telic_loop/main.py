@@ -4,15 +4,26 @@ from __future__ import annotations
 
 import json
 import os
+import subprocess
 import sys
 import time
+import traceback
+from collections.abc import Iterator
 from dataclasses import asdict
+from datetime import datetime
 from pathlib import Path
 
-from .agent import Agent, AgentRole, RateLimitError, load_prompt, parse_rate_limit_wait_seconds
+from .agent import (
+    PLAYWRIGHT_MCP_TOOLS, Agent, AgentRole, RateLimitError, _sync_state, load_prompt,
+    parse_rate_limit_wait_seconds,
+)
 from .config import LoopConfig
+from .errors import FailureTrail, backoff_seconds, classify_error, log_crash_jsonl
+from .git import ensure_gitignore, git_commit, setup_sprint_branch
 from .render import generate_delivery_report, render_plan_snapshot, render_value_checklist
-from .state import LoopState
+from .state import FailureRecord, LoopState
+from .testing import run_tests_parallel
+from .tools import _requires_browser_evidence
 
 
 # ---------------------------------------------------------------------------
@@ -188,7 +199,6 @@ def _detect_start_command(config: LoopConfig) -> str | None:
 
 def _needs_browser_eval(state: LoopState) -> bool:
     """True if the deliverable likely has a UI that needs browser evaluation."""
-    from .tools import _requires_browser_evidence
     return _requires_browser_evidence(state)
 
 
@@ -203,10 +213,10 @@ def _run_evaluate_phase(config: LoopConfig, state: LoopState, agent: Agent) -> b
     )
 
     # Add Playwright MCP for UI evaluation
+    browser_eval = _needs_browser_eval(state)
     mcp_servers = {}
     extra_tools: list[str] = []
-    if _needs_browser_eval(state):
-        from .agent import PLAYWRIGHT_MCP_TOOLS
+    if browser_eval:
         mcp_servers = {
             "playwright": {
                 "command": "npx",
@@ -228,7 +238,7 @@ def _run_evaluate_phase(config: LoopConfig, state: LoopState, agent: Agent) -> b
         "Report findings via report_eval_finding. "
         "Use verdict 'SHIP_READY' if ready to ship, or list issues to fix."
     )
-    if _needs_browser_eval(state):
+    if browser_eval:
         start_cmd = _detect_start_command(config)
         if start_cmd:
             user_msg += (
@@ -257,8 +267,6 @@ def _run_evaluate_phase(config: LoopConfig, state: LoopState, agent: Agent) -> b
 
 def _run_verifications(config: LoopConfig, state: LoopState) -> None:
     """Run verification scripts and update state with results."""
-    from .testing import run_tests_parallel
-
     pending = [
         v for v in state.verifications.values()
         if v.status in ("pending", "failed") and v.script_path
@@ -268,9 +276,6 @@ def _run_verifications(config: LoopConfig, state: LoopState) -> None:
 
     results = run_tests_parallel(pending, timeout=120)
 
-    from .state import FailureRecord
-    from datetime import datetime
-
     for vid, (exit_code, stdout, stderr) in results.items():
         v = state.verifications.get(vid)
         if not v:
@@ -360,6 +365,17 @@ def _format_budget_warning(config: LoopConfig, state: LoopState) -> str:
 # Post-delivery documentation
 # ---------------------------------------------------------------------------
 
+_DOC_TREE_SKIP_DIRS = {".loop", "node_modules"}
+
+
+def _iter_project_files(proj: Path) -> Iterator[Path]:
+    """Yield project-relative file paths in per-directory sorted order, pruning skipped dirs."""
+    for root, dirs, files in os.walk(proj):
+        dirs[:] = sorted(d for d in dirs if d not in _DOC_TREE_SKIP_DIRS)
+        for name in sorted(f for f in files if f not in _DOC_TREE_SKIP_DIRS):
+            yield (Path(root) / name).relative_to(proj)
+
+
 def _precompute_doc_context(config: LoopConfig) -> str:
     """Scan project dir for existing docs, package metadata, and source tree."""
     proj = config.effective_project_dir
@@ -398,15 +414,11 @@ def _precompute_doc_context(config: LoopConfig) -> str:
     # Source file tree (max 100 entries)
     lines.append("### Source file tree:")
     lines.append("```")
-    count = 0
-    for f in sorted(proj.rglob("*")):
-        if f.is_file() and ".loop" not in f.parts and "node_modules" not in f.parts:
-            rel = f.relative_to(proj)
-            lines.append(str(rel))
-            count += 1
-            if count >= 100:
-                lines.append("... (truncated)")
-                break
+    for count, rel in enumerate(_iter_project_files(proj)):
+        if count >= 100:
+            lines.append("... (truncated)")
+            break
+        lines.append(str(rel))
     lines.append("```")
 
     return "\n".join(lines)
@@ -438,7 +450,6 @@ def _generate_project_docs(
         state.pass_gate("docs_generated")
         state.save(config.state_file)
 
-        from .git import git_commit
         git_commit(config, state, f"telic-loop({config.sprint}): docs generated")
 
         print("  Project documentation generated successfully.")
@@ -494,8 +505,6 @@ def _run_iteration(
     phase: str, iteration: int,
 ) -> bool:
     """Execute one loop iteration. Returns True if loop should halt (deliver + exit)."""
-    from .git import git_commit
-
     print(f"\n── Iteration {iteration} ── Phase: {phase}")
 
     # Timing + token tracking
@@ -598,26 +607,15 @@ def _log_iteration_crash(
     phase: str, exc: Exception, iteration: int,
 ) -> dict:
     """Log a crash during a loop iteration and reset in_progress tasks."""
-    from datetime import datetime
-    import traceback
-    from .agent import _sync_state
-    from .errors import FailureTrail, classify_error, log_crash_jsonl
-
     error_kind = classify_error(exc)
     print(f"\n  CRASH in {phase} [{error_kind}]: {type(exc).__name__}: {exc}")
     traceback.print_exc()
 
     # Reload state from disk first — tool CLI may have written progress
-    # that the in-memory state doesn't have (sync skipped on crash)
+    # that the in-memory state doesn't have (sync skipped on crash).
+    # _sync_state keeps the in-memory token counters.
     if config.state_file.exists():
-        updated = LoopState.load(config.state_file)
-        saved_tokens = state.total_tokens_used
-        saved_input = state.total_input_tokens
-        saved_output = state.total_output_tokens
-        _sync_state(state, updated)
-        state.total_tokens_used = saved_tokens
-        state.total_input_tokens = saved_input
-        state.total_output_tokens = saved_output
+        _sync_state(state, LoopState.load(config.state_file))
 
     # Extract failure trail if attached by agent.py send()
     trail: FailureTrail | None = getattr(exc, "_failure_trail", None)
@@ -707,7 +705,6 @@ def _release_lock(lock_path: Path) -> None:
 
 def _ensure_git_repo(config: LoopConfig) -> None:
     """Ensure we're in a git repository."""
-    import subprocess
     result = subprocess.run(
         ["git", "rev-parse", "--is-inside-work-tree"],
         capture_output=True, text=True,
@@ -727,7 +724,6 @@ def _recover_interrupted_rollback(config: LoopConfig, state: LoopState) -> None:
     try:
         wal_data = json.loads(wal_path.read_text(encoding="utf-8"))
         if wal_data.get("status") == "started":
-            import subprocess
             subprocess.run(
                 ["git", "reset", "--hard", wal_data["to_hash"]],
                 check=True,
@@ -759,8 +755,6 @@ def _guess_sprint_dir() -> Path | None:
 
 def main() -> None:
     """CLI entry point with crash recovery."""
-    from .errors import backoff_seconds, classify_error, log_crash_jsonl
-
     max_restarts = 3
     for attempt in range(1, max_restarts + 1):
         try:
@@ -772,7 +766,6 @@ def main() -> None:
             error_kind = classify_error(exc)
             print(f"\n{'=' * 60}")
             print(f"  LOOP CRASHED (attempt {attempt}/{max_restarts}) [{error_kind}]")
-            import traceback
             traceback.print_exc()
             print(f"{'=' * 60}")
 
@@ -799,8 +792,6 @@ def main() -> None:
 
 def _run_main() -> None:
     """Core loop logic — called by main() with crash recovery."""
-    from .git import ensure_gitignore, setup_sprint_branch
-
     if len(sys.argv) < 2:
         print("Usage: telic-loop <sprint-name> [--sprint-dir <path>] [--project-dir <path>]")
         sys.exit(1)
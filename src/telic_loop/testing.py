@@ -82,9 +82,8 @@ def _to_bash_path(path: Path) -> str:
     return posix
 
 
-def _build_script_command(script_path: str) -> list[str] | str:
-    """Build the correct command to run a verification script cross-platform."""
-    p = _resolve_script_path(script_path)
+def _build_script_command(p: Path) -> list[str] | str:
+    """Build the correct command to run a resolved verification script cross-platform."""
     suffix = p.suffix.lower()
 
     if suffix == ".py":
@@ -120,9 +119,9 @@ def _execute_single_test(
     """Run a single verification script. Returns (test_id, (exit_code, stdout, stderr))."""
     tmp_dir: str | None = None
     try:
-        cmd = _build_script_command(test.script_path)
-        use_shell = isinstance(cmd, str)
         script_path_resolved = _resolve_script_path(test.script_path)
+        cmd = _build_script_command(script_path_resolved)
+        use_shell = isinstance(cmd, str)
         script_dir = script_path_resolved.parent
 
         if not script_dir.exists() and script_path_resolved.exists():
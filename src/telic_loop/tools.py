@@ -181,33 +181,42 @@ _RECOMMENDATION_MAP = {
 # ---------------------------------------------------------------------------
 
 _META_PATTERNS = [
-    re.compile(r"^(continue|proceed|begin|start|resume)\b.*\b(with|execution|phase|tasks?)\b", re.I),
-    re.compile(r"\btasks?\s+\d+\.\d+[\s-]+(through|to)\s+\d+\.\d+", re.I),
-    re.compile(r"\brun\s+tasks?\s+\d+", re.I),
-    re.compile(r"^no\s+(new\s+)?tasks?\s+(needed|required)", re.I),
-    re.compile(r"\bmark(ed)?\s+(as\s+)?done\b", re.I),
-    re.compile(r"\bsequentially\s+to\s+build\b", re.I),
-    re.compile(r"\bcovered\s+by\s+existing\s+tasks?\b", re.I),
-    re.compile(r"\balready\s+(covered|handled|addressed)\b", re.I),
-    re.compile(r"\bexisting\s+tasks?\s+\d+\.\d+\s+covers\b", re.I),
-    re.compile(r"\bno\s+new\s+task\s+(needed|required)\b", re.I),
+    r"^(continue|proceed|begin|start|resume)\b.*\b(with|execution|phase|tasks?)\b",
+    r"\btasks?\s+\d+\.\d+[\s-]+(through|to)\s+\d+\.\d+",
+    r"\brun\s+tasks?\s+\d+",
+    r"^no\s+(new\s+)?tasks?\s+(needed|required)",
+    r"\bmark(ed)?\s+(as\s+)?done\b",
+    r"\bsequentially\s+to\s+build\b",
+    r"\bcovered\s+by\s+existing\s+tasks?\b",
+    r"\balready\s+(covered|handled|addressed)\b",
+    r"\bexisting\s+tasks?\s+\d+\.\d+\s+covers\b",
+    r"\bno\s+new\s+task\s+(needed|required)\b",
 ]
 
 _OVERSIZED_PATTERNS = [
-    re.compile(r"\ball\s+(remaining|epic|planned|pending|unbuilt)\b", re.I),
-    re.compile(r"\bentire\s+(epic|frontend|backend|app|project|system)\b", re.I),
-    re.compile(r"\beverything\s+(for|in|from)\b", re.I),
+    r"\ball\s+(remaining|epic|planned|pending|unbuilt)\b",
+    r"\bentire\s+(epic|frontend|backend|app|project|system)\b",
+    r"\beverything\s+(for|in|from)\b",
 ]
 
 
+def _compile_any(patterns: list[str]) -> re.Pattern[str]:
+    """Compile alternatives into one regex so a description is scanned once."""
+    return re.compile("|".join(f"(?:{p})" for p in patterns), re.I)
+
+
+_META_RE = _compile_any(_META_PATTERNS)
+_OVERSIZED_RE = _compile_any(_OVERSIZED_PATTERNS)
+
+
 def _is_meta_instruction(description: str) -> bool:
     """Detect descriptions that are execution instructions, not implementation specs."""
-    return any(p.search(description) for p in _META_PATTERNS)
+    return _META_RE.search(description) is not None
 
 
 def _is_oversized_scope(description: str) -> bool:
     """Detect descriptions that bundle too many deliverables into one task."""
-    return any(p.search(description) for p in _OVERSIZED_PATTERNS)
+    return _OVERSIZED_RE.search(description) is not None
 
 
 def _validate_add(task_id: str, input_data: dict, state: LoopState) -> str | None:
@@ -217,11 +226,11 @@ def _validate_add(task_id: str, input_data: dict, state: LoopState) -> str | Non
         return f"Task {task_id} missing: {', '.join(missing)}"
 
     desc = input_data["description"]
-    new_desc_lower = desc.lower()
+    new_words = _word_set(desc)
     for existing in state.tasks.values():
         if existing.status in COMPLETE_STATUSES:
             continue
-        sim = _jaccard_similarity(new_desc_lower, existing.description.lower())
+        sim = _jaccard_similarity(new_words, _word_set(existing.description))
         if sim >= DUPLICATE_SIMILARITY_THRESHOLD:
             return f"Task {task_id} duplicates {existing.task_id} ({sim:.0%} similar)"
 
@@ -314,8 +323,11 @@ def validate_task_mutation(action: str, input_data: dict, state: LoopState) -> s
     return None
 
 
-def _jaccard_similarity(a: str, b: str) -> float:
-    wa, wb = set(a.split()), set(b.split())
+def _word_set(text: str) -> frozenset[str]:
+    return frozenset(text.lower().split())
+
+
+def _jaccard_similarity(wa: frozenset[str], wb: frozenset[str]) -> float:
     return len(wa & wb) / len(wa | wb) if (wa or wb) else 0.0
 
 